@@ -13,7 +13,8 @@ EXTENSIONS = ['src.pug', 'src.eggs']
 
 if __name__ == '__main__':
     from src.bot_stuff import Bot
-    bot = Bot(command_prefix=commands.when_mentioned)
+    # we only use raw events and message ids, so we don't need a message cache
+    bot = Bot(command_prefix=commands.when_mentioned, max_messages=None)
 
     @bot.listen()
     async def on_ready():
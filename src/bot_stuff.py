@@ -1,6 +1,8 @@
 import asyncio
 from collections import defaultdict
 from itertools import chain, starmap
+import json
+import logging
 from operator import attrgetter as get
 
 from discord import Embed, Message
@@ -10,12 +12,21 @@ from .utils import as_fut, create_index, first, invert_dict, retval_as_fut
 
 # TODO: rename file to discord_stuff?
 
+log = logging.getLogger(__name__)
+
 
 class Bot(commands.Bot):
     @property
     def user_id(self):
         return self._connection.self_id
 
+    def user_name(self, user_id):
+        # get_user() returns None if the user isn't cached, so fall back to
+        # their id. this is used in embed footers/titles and logs, where
+        # mentions don't render.
+        user = self.get_user(user_id)
+        return str(user) if user is not None else str(user_id)
+
     def send_message(self, chan_id, content_or_embed=None, /, *, content=None, embed=None):
         if content_or_embed:
             assert content is embed is None
@@ -66,8 +77,13 @@ class Bot(commands.Bot):
 async def update_discord(bot, chan_id, msg_ids, key_to_msg, key_to_new_msg, old_reacts, new_reacts):
     assert msg_ids.keys() == key_to_msg.keys()
 
+    # compare messages by what they'd look like on discord, so that states
+    # re-rendering an identical embed don't cause an edit
+    key_to_content     = { key: msg_content(msg) for key, msg in key_to_msg.items() }
+    key_to_new_content = { key: msg_content(msg) for key, msg in key_to_new_msg.items() }
+
     # create a mapping from message content -> keys of messages with that content
-    msg_to_keys = defaultdict(set, invert_dict(key_to_msg))
+    msg_to_keys = defaultdict(set, invert_dict(key_to_content))
 
     # awaitables to run. we'll only run these at the very end, so that if an
     # error happens halfway through this function we won't leave discord in a
@@ -80,25 +96,25 @@ async def update_discord(bot, chan_id, msg_ids, key_to_msg, key_to_new_msg, old_
     """
     # key, msg -> key, msg
     def no_change(key, msg, free_keys):
-        if key in free_keys and msg == key_to_msg[key]:
-            print(f"{key} -> {key} (no_change)")
+        if key in free_keys and key_to_new_content[key] == key_to_content[key]:
+            log.debug("%s -> %s (no_change)", key, key)
             return key
 
     # different_key, msg -> key, msg
     def change_key(key, msg, free_keys):
-        if (cand_keys := msg_to_keys[msg] & free_keys):
+        if (cand_keys := msg_to_keys[key_to_new_content[key]] & free_keys):
             # prioritize keys that can't be used by change_msg(). there
             # might still be broken edge cases here, not sure...
             key_to_use = next(chain(cand_keys - key_to_new_msg.keys(), cand_keys))
-            print(f"{key_to_use} -> {key} (change_key)")
+            log.debug("%s -> %s (change_key)", key_to_use, key)
             return key_to_use
 
     # key, different_msg -> key, msg
     def change_msg(key, msg, free_keys):
         if key in free_keys:
-            assert msg != key_to_msg[key]
+            assert key_to_new_content[key] != key_to_content[key]
             aws.append(bot.edit_message(chan_id, msg_ids[key], msg))
-            print(f"{key} -> {key} (change_msg)")
+            log.debug("%s -> %s (change_msg)", key, key)
             return key
 
 
@@ -134,13 +150,13 @@ async def update_discord(bot, chan_id, msg_ids, key_to_msg, key_to_new_msg, old_
 
     # create new messages for anything that wasn't mapped to an existing message
     for key in unmapped:
-        print(f"None -> {key} (send_msg)")
+        log.debug("None -> %s (send_msg)", key)
         msg_id_futs[key], coro = retval_as_fut(bot.send_message(chan_id, key_to_new_msg[key]))
         aws.append(coro)
 
     # delete unused messages
     for key in free_keys:
-        print(f"{key} -> {None} (del_msg)")
+        log.debug("%s -> None (del_msg)", key)
         aws.append(bot.delete_message(chan_id, msg_ids[key]))
 
 
@@ -181,7 +197,9 @@ async def update_discord(bot, chan_id, msg_ids, key_to_msg, key_to_new_msg, old_
     def remove_react_by_user(user_id, emoji):
         return bot.remove_reaction(chan_id, main_id, emoji, user_id)
 
-    aws.extend(remove_reacts(old_reacts - new_reacts))
+    # there's no point removing reacts if the old main message is being deleted
+    if main_key not in free_keys:
+        aws.extend(remove_reacts(old_reacts - new_reacts))
 
     # run all the tasks now
     await asyncio.gather(*aws)
@@ -192,5 +210,12 @@ async def update_discord(bot, chan_id, msg_ids, key_to_msg, key_to_new_msg, old_
     return { key: msg_id_futs[key].result() for key in key_to_new_msg }
 
 
+def msg_content(msg):
+    # Embed doesn't define __eq__ or __hash__, so compare them by their contents
+    if isinstance(msg, Embed):
+        return (Embed, json.dumps(msg.to_dict(), sort_keys=True))
+    return msg
+
+
 def mention(user_id):
     return f'<@{user_id}>'
@@ -1,5 +1,6 @@
 import asyncio
 from dataclasses import dataclass, replace
+import logging
 import random
 from typing import FrozenSet, Tuple
 
@@ -10,6 +11,8 @@ from .pug import update_state
 from .states import State, StoppedState, React, EMPTY, DONE_EMOJI
 from .utils import fset
 
+log = logging.getLogger(__name__)
+
 def setup(bot):
     from src.mem import chan_ctxs
 
@@ -135,7 +138,7 @@ class WallState(State):
                 text = text + '\n'
                 reacts = reacts - { r }
 
-            print(f"{state.bot.get_user(r.user_id)}: {text}")
+            log.debug("%s: %s", r.user_id, text)
         yield replace(state, reacts=reacts, text=text)
 
 
@@ -146,7 +149,7 @@ class DanceState(State):
 
     @property
     def messages(state):
-        title = ' '.join(str(state.bot.get_user(u)) for u in state.users)
+        title = ' '.join(map(state.bot.user_name, state.users))
         mentions = ' '.join(map(mention, state.users))
         description = (('\n' + mentions + EMPTY.join([' ']*5))
                        .join(DANCE[state.dance_idx].split('\n')))
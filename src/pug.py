@@ -1,6 +1,7 @@
 import asyncio
 from dataclasses import dataclass, field, replace
 from itertools import chain
+import logging
 import random
 import sys
 import textwrap
@@ -12,9 +13,12 @@ from discord import ChannelType, Colour, Embed, Object, TextChannel
 from discord.ext import commands
 
 from .bot_stuff import Bot, update_discord
+from .mem import chan_ctxs
 from .states import React, State, StoppedState, IdleState
 from .utils import fset, first, anext
 
+log = logging.getLogger(__name__)
+
 MAP_LIST = [
     # tier 1: classics
     [
@@ -117,7 +121,6 @@ class ChanCtx:
 
 
 def setup(bot):
-    from src.mem import chan_ctxs
     chan_ctxs.default_factory = lambda: ChanCtx(StoppedState(
         bot=bot, admin_ids={ bot.owner_id },
         reacts=fset(), history=tuple(),
@@ -167,7 +170,11 @@ def setup(bot):
     @bot.command(hidden=True)
     async def poke(ctx):
         channel = ctx.channel
-        chan_ctx = chan_ctxs[channel.id]
+        chan_ctx = chan_ctxs.get(channel.id)
+        if chan_ctx is None:
+            await ctx.send(f"I'm not running in {channel.mention}")
+            return
+
         await update_state(bot, chan_ctx, channel.id, lambda c: c.state)
         await ctx.send(f"poked")
 
@@ -210,8 +217,10 @@ def setup(bot):
             channel = ctx.channel
         channel_name = getattr(channel, 'mention', f"'{channel}'")
 
-        chan_ctx = chan_ctxs[channel.id]
-        if isinstance(chan_ctx.state, StoppedState):
+        # use get() so we don't create a context (and lock) for channels we
+        # were never started in
+        chan_ctx = chan_ctxs.get(channel.id)
+        if chan_ctx is None or isinstance(chan_ctx.state, StoppedState):
             await ctx.send(f"I'm not running in {channel_name}")
             return
 
@@ -266,11 +275,12 @@ def setup(bot):
     async def on_raw_reaction(event):
         # ignore the bot's reactions
         if event.user_id == bot.user_id:
-            print("ignored bot")
+            log.debug("ignored bot")
             return
 
         # ignore reactions to channels we aren't watching
-        if event.channel_id not in chan_ctxs:
+        chan_ctx = chan_ctxs.get(event.channel_id)
+        if chan_ctx is None:
             return
 
         react = React(event.user_id, str(event.emoji))
@@ -279,8 +289,7 @@ def setup(bot):
         else:
             update = lambda reacts: reacts - { react }
 
-        await update_reacts(bot, chan_ctxs[event.channel_id],
-                            event.channel_id, event.message_id, update)
+        await update_reacts(bot, chan_ctx, event.channel_id, event.message_id, update)
 
 
 def rand_map(lowest_tier):
@@ -340,6 +349,9 @@ async def update_state(bot, ctx, chan_id, next_state_fn):
 
     state_seq = state_sequence(curr_state)
     while (next_state := await anext(state_seq, None)) is not None:
+        # render the messages before taking the lock. the discord updates have
+        # to stay under the lock, since 'ctx' has to match what's on discord.
+        next_msgs = next_state.messages
         async with ctx.lock:
             if ctx.state is not curr_state:
                 # someone changed the state while we were getting the next one,
@@ -349,9 +361,9 @@ async def update_state(bot, ctx, chan_id, next_state_fn):
             # NOTE: we use the messages and reacts from 'ctx', NOT 'curr_state'
             #       since we don't know whether that state was fully applied.
             next_msg_id_map = await update_discord(bot, chan_id, ctx.msg_id_map,
-                                                  ctx.messages, next_state.messages,
+                                                  ctx.messages, next_msgs,
                                                   ctx.reacts, next_state.reacts)
-            ctx.messages = next_state.messages
+            ctx.messages = next_msgs
             ctx.state    = next_state
             if first(ctx.msg_id_map.values()) == first(next_msg_id_map.values()):
                 ctx.reacts = next_state.reacts
@@ -360,9 +372,16 @@ async def update_state(bot, ctx, chan_id, next_state_fn):
                 # reacts. we also remake the state sequence with the updated reacts.
                 ctx.reacts = next_state.reacts - ctx.reacts
                 state_seq = state_sequence(replace(next_state, reacts=ctx.reacts))
-                print("restarting seq")
+                log.debug("restarting seq")
             ctx.msg_id_map = next_msg_id_map
         curr_state = next_state
+
+    async with ctx.lock:
+        # forget about channels once they've stopped, so that we don't keep
+        # their context (and lock) around forever
+        if (ctx.state is curr_state and isinstance(curr_state, StoppedState)
+                and chan_ctxs.get(chan_id) is ctx):
+            del chan_ctxs[chan_id]
     return curr_state
 
 
@@ -372,6 +391,11 @@ async def update_reacts(bot, ctx, chan_id, msg_id, update_reacts_fn):
         # TODO: track reacts to all messages?
         if msg_id != first(ctx.msg_id_map.values()):
             return
-        ctx.reacts = frozenset(update_reacts_fn(ctx.reacts))
+        next_reacts = frozenset(update_reacts_fn(ctx.reacts))
+        # reacts that we added/removed ourselves come back to us as events, but
+        # they've already been applied, so there's nothing to update
+        if next_reacts == ctx.reacts:
+            return
+        ctx.reacts = next_reacts
 
     await update_state(bot, ctx, chan_id, lambda ctx: replace(ctx.state, reacts=ctx.reacts))
@@ -2,6 +2,7 @@ from collections import defaultdict, Counter
 from dataclasses import dataclass, fields, replace
 from itertools import chain
 from functools import cached_property
+import logging
 from operator import attrgetter as get
 import random
 from typing import Tuple, FrozenSet, NamedTuple, Union
@@ -12,6 +13,8 @@ from flag import flag
 from .bot_stuff import Bot, mention
 from .utils import create_index, fset, user_set
 
+log = logging.getLogger(__name__)
+
 
 class React(NamedTuple):
     user_id: int
@@ -78,18 +81,19 @@ class IdleState(State):
     def messages(state):
         # for the player emoji, pick a random one that someone's reacted with,
         # with a default if there's no player reacts yet
-        choices = { r.emoji for r in state.reacts } - { HOST_EMOJI, CAPT_EMOJI , SKIP_EMOJI, WAIT_EMOJI }
+        # reacts_by_emoji is a defaultdict, so skip the empty entries that lookups leave behind
+        choices = { e for e, rs in state.reacts_by_emoji.items() if rs } - { HOST_EMOJI, CAPT_EMOJI , SKIP_EMOJI, WAIT_EMOJI }
         player_emoji = random.choice(list(choices) or [PLAYER_EMOJI])
 
         if state.admin_wait:
             # TODO: use get_member() so we can use display_name.
             #       for that we need to get the channel id from somewhere...
-            pauser_names = (str(state.bot.get_user(r.user_id).name) for r in state.admin_wait)
+            pauser_names = (state.bot.user_name(r.user_id) for r in state.admin_wait)
             footer = f"PUG paused by {', '.join(pauser_names)}. Waiting for them to unpause..."
         elif state.enough_ppl or state.admin_skip:
             footer = 'PUG starting now...'
         else:
-            admin_names = (str(state.bot.get_user(user_id)) for user_id in state.admin_ids)
+            admin_names = map(state.bot.user_name, state.admin_ids)
             footer = (
                 f"The PUG will automatically start when there are {MIN_PLAYERS} players.\n"
                 f"If there aren't enough hosts/captains, a vote including all players will start.\n"
@@ -141,9 +145,11 @@ class IdleState(State):
 
     @cached_property
     def player_ids(state):
-        return (user_set(state.reacts - state.reacts_by_emoji[HOST_EMOJI]
-                                      - state.admin_wait - state.admin_skip)
-                                      - { state.bot.user_id })
+        # filter while iterating, instead of building sets just to subtract them
+        admin_reacts = state.admin_wait | state.admin_skip
+        return fset(r.user_id for r in state.reacts
+                    if r.user_id != state.bot.user_id and r.emoji != HOST_EMOJI
+                                                      and r not in admin_reacts)
     @property
     def enough_ppl(state):
         return len(state.player_ids) >= MIN_PLAYERS
@@ -172,9 +178,9 @@ class VoteState(State):
             return PickState.make(state, host_id, tuple(capt_ids), fset(player_ids) - set(capt_ids))
         return state
 
-    @property
+    @cached_property
     def messages(state):
-        admin_names = (str(state.bot.get_user(u)) for u in state.admin_ids)
+        admin_names = map(state.bot.user_name, state.admin_ids)
         players_that_didnt_react = (set(state.player_ids) - { r.user_id for r in state.reacts})
         embed = (Embed(
             title='**PUG voting**',
@@ -284,7 +290,7 @@ class PickState(State):
         assert len(capt_ids) == 2
         return super().make(from_state, host_id, tuple(capt_ids), fset(player_ids))
 
-    @property
+    @cached_property
     def messages(state):
         teams_full = (len(state.red_ids) == len(state.blu_ids) == state.team_size)
         if teams_full:
@@ -354,14 +360,14 @@ class PickState(State):
                                 if u in state.unpicked_ids }
         if not capt_picks:
             yield (state := replace(state, reacts=reacts))
-            print("no pick")
+            log.debug("no pick")
             return
 
         # add the picked player to the team
         _, picked_emoji = next(iter(capt_picks))
         picked_id = next(u for u, e in zip(state.player_ids, OPTION_EMOJIS)
                            if e == picked_emoji)
-        print(f"team {picking_team} picked {picked_id}")
+        log.debug("team %s picked %s", picking_team, picked_id)
         team_ids = list(state.team_ids)  # modifying nested tuples... bleh
         team_ids[picking_team] = (*team_ids[picking_team], picked_id)
         team_ids = tuple(team_ids)
@@ -403,16 +409,16 @@ class RunningState(State):
 
     @classmethod
     def make_random(cls, from_state, *player_ids):
-        player_ids = set(player_ids)  # get rid of duplicates
-        assert len(player_ids) >= 2
+        shuffled_ids = list(set(player_ids))  # get rid of duplicates
+        assert len(shuffled_ids) >= 2
 
-        shuffled_ids = random.sample(player_ids, k=len(player_ids))
+        random.shuffle(shuffled_ids)
         team_size = len(shuffled_ids) // 2
         host_id = shuffled_ids[-1]
-        red_ids = shuffled_ids[:team_size]
-        blu_ids = shuffled_ids[team_size:team_size * 2]
+        red_ids = tuple(shuffled_ids[:team_size])
+        blu_ids = tuple(shuffled_ids[team_size:team_size * 2])
 
-        return cls.make(from_state, host_id, tuple(red_ids), tuple(blu_ids))
+        return cls.make(from_state, host_id, red_ids, blu_ids)
 
 
     @cached_property
@@ -23,6 +23,8 @@ def mock_bot(bot):
     mock_bot.clear_reaction.return_value = as_fut(None)
     mock_bot.clear_reactions.return_value = as_fut(None)
 
+    mock_bot.user_name.side_effect = str
+
     return mock_bot
 
 
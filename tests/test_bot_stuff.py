@@ -203,6 +203,21 @@ async def test_update_msgs_remap_optimal(mock_bot, chan_id):
     assert mock_bot.send_message.call_count == 0
     assert mock_bot.delete_message.call_args_list == exp_dels
 
+@pytest.mark.asyncio
+async def test_update_msgs_same_embed(mock_bot, chan_id):
+    # embeds with the same contents shouldn't cause an edit, even if they're
+    # different objects
+    prev_msgs  = { 'cat': Embed(title='cat'), 'dog': 'dog_msg' }
+    next_msgs  = { 'cat': Embed(title='cat'), 'dog': 'dog_msg' }
+    msg_id_map = { 'cat': 0, 'dog': 1 }
+    exp_id_map = msg_id_map
+
+    msg_id_map = await update_discord(mock_bot, chan_id, msg_id_map, prev_msgs, next_msgs, set(), set())
+    assert list(exp_id_map.items()) == list(msg_id_map.items())
+    assert mock_bot.edit_message.call_count == 0
+    assert mock_bot.send_message.call_count == 0
+    assert mock_bot.delete_message.call_count == 0
+
 
 @pytest.mark.asyncio
 async def test_update_reacts_noop(mock_bot, chan_id):
@@ -285,4 +300,20 @@ async def test_update_reacts_dont_nuke(mock_bot, chan_id):
     assert mock_bot.clear_reaction.call_count == 1
     assert mock_bot.clear_reactions.call_count == 0
 
-# TODO: tests for when main message changes
+@pytest.mark.asyncio
+async def test_update_reacts_main_msg_deleted(mock_bot, chan_id):
+    prev_msgs  = { 'old': 'old_msg' }
+    next_msgs  = { 'new': 'new_msg' }
+    msg_id_map = { 'old': 'old_msg_id' }
+
+    prev_reacts = { React('bob', 'XD'), React('alice', 'XD'), React('tom', ':)') }
+    next_reacts = set()
+
+    # the old message gets deleted, so we shouldn't bother removing its reacts
+    await update_discord(mock_bot, chan_id, msg_id_map, prev_msgs, next_msgs, prev_reacts, next_reacts)
+    assert mock_bot.delete_message.call_args_list == [call(chan_id, 'old_msg_id')]
+    assert mock_bot.remove_reaction.call_count == 0
+    assert mock_bot.clear_reaction.call_count == 0
+    assert mock_bot.clear_reactions.call_count == 0
+
+# TODO: more tests for when main message changes